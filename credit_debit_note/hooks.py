@@ -92,7 +92,7 @@ fixtures = [
 # ------------
 
 # before_install = "credit_debit_note.install.before_install"
-# after_install = "credit_debit_note.install.after_install"
+after_install = "credit_debit_note.install.after_install"
 
 # Uninstallation
 # ------------
@@ -0,0 +1,6 @@
+from credit_debit_note.patches.v1_0.add_sales_invoice_indexes import execute as add_sales_invoice_indexes
+
+
+def after_install():
+	# patches are marked as run on a fresh install, so apply the indexes here too
+	add_sales_invoice_indexes()
@@ -0,0 +1,7 @@
+import frappe
+
+
+def execute():
+	# Sales reports filter submitted invoices on a posting_date range and join on customer
+	frappe.db.add_index("Sales Invoice", ["docstatus", "posting_date", "customer"])
+	frappe.db.add_index("Sales Invoice Item", ["item_code", "parent"])